@@ -7,17 +7,20 @@ Monitors file write operations for Sonarr, Radarr, Lidarr, etc.
 
 import os
 import sys
+import stat
 import time
 import curses
 from curses import window as CursesWindow
-import psutil
 import argparse
 import re
+import bisect
+import functools
+import itertools
+import math
 import platform
-from pathlib import Path
 from datetime import datetime
 from threading import Lock
-from typing import Optional, Dict, Tuple, List, NamedTuple, TextIO
+from typing import Optional, Dict, Tuple, List, NamedTuple, Set
 
 # Check for Linux early
 if platform.system() != 'Linux':
@@ -25,91 +28,192 @@ if platform.system() != 'Linux':
     print(f"Detected OS: {platform.system()}", file=sys.stderr)
     sys.exit(1)
 
+# Most iovecs a single writev() accepts
+LOG_IOV_MAX = os.sysconf('SC_IOV_MAX') if 'SC_IOV_MAX' in os.sysconf_names else 1024
+
 # Try to import wcwidth for proper double-width character handling
 try:
-    from wcwidth import wcswidth
+    from wcwidth import wcswidth, wcwidth
     HAS_WCWIDTH = True
 except ImportError:
     HAS_WCWIDTH = False
 
 class DebugLogger:
-    """Thread-safe debug logger with context manager support"""
-    def __init__(self, filepath: Optional[str] = None):
+    """Thread-safe debug logger with context manager support
+    
+    Lines are buffered in memory and written with one writev() per flush:
+    when the buffer passes Config.LOG_FLUSH_THRESHOLD_BYTES, when flush() is
+    called (once per monitor tick), and when the context exits. The log is
+    never fsync()ed. With in_memory=True the lines go to a memfd instead and
+    reach the real file in one sendfile() pass on exit.
+    """
+    def __init__(self, filepath: Optional[str] = None, in_memory: bool = False):
         self.filepath = filepath
-        self.file_handle: Optional[TextIO] = None
+        self.in_memory = in_memory
+        self.fd: Optional[int] = None
+        self._dest_fd: Optional[int] = None
         self.lock = Lock()
+        self._pending: List[bytes] = []
+        self._pending_bytes = 0
+        self._timestamp_second = -1
+        self._timestamp_prefix = ""
     
     def __enter__(self):
         """Open log file when entering context"""
         if self.filepath:
             try:
-                self.file_handle = open(self.filepath, 'w')
-                self.file_handle.write(f"=== *arr Monitor Debug Log - {datetime.now()} ===\n\n")
-                self.file_handle.flush()
+                self._dest_fd = os.open(self.filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o666)
+                if self.in_memory and hasattr(os, 'memfd_create'):
+                    # Log into anonymous memory; copied to the real file on exit
+                    try:
+                        self.fd = os.memfd_create("arr-monitor-log", os.MFD_CLOEXEC)
+                    except OSError:
+                        # memfd unavailable (ENOSYS under seccomp, EMFILE, ...);
+                        # log straight to the file instead
+                        self.fd = None
+                if self.fd is None:
+                    self.fd, self._dest_fd = self._dest_fd, None
+                os.write(self.fd, f"=== *arr Monitor Debug Log - {datetime.now()} ===\n\n".encode())
             except OSError as e:
                 print(f"Warning: Could not create debug log at {self.filepath}: {e}")
-                self.file_handle = None
+                self._close_fds()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Close log file when exiting context"""
-        if self.file_handle:
-            try:
-                self.file_handle.close()
-            except OSError:
-                pass
+        """Flush buffered lines and close log file when exiting context"""
+        if self.fd is not None:
+            self.flush()
+            if self._dest_fd is not None:
+                self._copy_to_destination()
+            self._close_fds()
         return False
     
-    def log(self, message: str) -> None:
-        """Write debug message to log file"""
-        if self.file_handle:
-            with self.lock:
+    def _copy_to_destination(self) -> None:
+        """Copy the in-memory log to the destination file"""
+        try:
+            remaining = os.fstat(self.fd).st_size
+            offset = 0
+            while remaining > 0:
+                sent = os.sendfile(self._dest_fd, self.fd, offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        except OSError as e:
+            print(f"Warning: Could not write debug log to {self.filepath}: {e}")
+    
+    def _close_fds(self) -> None:
+        """Close the log and destination descriptors"""
+        for fd in (self.fd, self._dest_fd):
+            if fd is not None:
                 try:
-                    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-                    self.file_handle.write(f"[{timestamp}] {message}\n")
-                    self.file_handle.flush()
+                    os.close(fd)
                 except OSError:
-                    # Silently ignore logging errors
                     pass
+        self.fd = None
+        self._dest_fd = None
+    
+    def log(self, message: str) -> None:
+        """Queue debug message for the log file"""
+        if self.fd is not None:
+            now = time.time()
+            second = int(now)
+            with self.lock:
+                # strftime only runs when the second rolls over
+                if second != self._timestamp_second:
+                    self._timestamp_second = second
+                    self._timestamp_prefix = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+                millis = int((now - second) * 1000)
+                line = f"[{self._timestamp_prefix}.{millis:03d}] {message}\n".encode(errors='replace')
+                self._pending.append(line)
+                self._pending_bytes += len(line)
+                if self._pending_bytes >= Config.LOG_FLUSH_THRESHOLD_BYTES:
+                    self._flush_locked()
+    
+    def flush(self) -> None:
+        """Write all queued lines to the log file"""
+        if self.fd is not None:
+            with self.lock:
+                self._flush_locked()
+    
+    def _flush_locked(self) -> None:
+        """Write queued lines with writev(); caller must hold self.lock"""
+        pending = self._pending
+        if not pending:
+            return
+        self._pending = []
+        self._pending_bytes = 0
+        try:
+            for start in range(0, len(pending), LOG_IOV_MAX):
+                chunk = pending[start:start + LOG_IOV_MAX]
+                written = os.writev(self.fd, chunk)
+                # Finish a short write with plain write() calls
+                if written < sum(map(len, chunk)):
+                    remainder = b''.join(chunk)[written:]
+                    while remainder:
+                        remainder = remainder[os.write(self.fd, remainder):]
+        except OSError:
+            # Silently ignore logging errors
+            pass
     
     @property
     def is_enabled(self) -> bool:
         """Check if logging is enabled"""
-        return self.file_handle is not None
+        return self.fd is not None
 
 # Media manager process names to auto-detect
 ARR_MANAGERS = [
     'Sonarr', 'Radarr', 'Lidarr', 'Readarr', 
     'Prowlarr', 'Bazarr', 'Whisparr'
 ]
+# Raw /proc/<pid>/comm values to match, so discovery never decodes non-matches
+ARR_MANAGER_COMMS = frozenset(name.encode('ascii') for name in ARR_MANAGERS)
 
 # File extensions to ignore (databases, logs, etc.)
-IGNORE_EXTENSIONS = {
+IGNORE_EXTENSIONS = frozenset({
     '.db', '.db-wal', '.db-shm', '.db-journal',
     '.log', '.txt', '.xml', '.json', '.conf',
     '.zip', '.dll'
-}
+})
 
 # File access modes from open() flags (O_RDONLY, O_WRONLY, O_RDWR)
 ACCESS_MODE_READ = 0
 ACCESS_MODE_WRITE = 1
 ACCESS_MODE_READWRITE = 2
 ACCESS_MODE_MASK = 0o3  # Mask to extract access mode from flags
+FDINFO_READ_SIZE = 4096  # Single read covers a whole /proc/<pid>/fdinfo/<fd> entry
+
+# Compiled pattern for the leading "pos:" and "flags:" fields of an fdinfo entry
+FDINFO_PATTERN = re.compile(rb'^pos:\s+(\d+).*?^flags:\s+([0-7]+)', re.MULTILINE | re.DOTALL)
 
 class ReadFileInfo(NamedTuple):
     """Information about a file being read by the process"""
     size: int
     path: str
 
+class WriteFileInfo(NamedTuple):
+    """Snapshot of a file being written by the process, from a single scan"""
+    fd: str
+    filepath: str
+    size: int
+    target_size: int
+    source_filepath: Optional[str]
+
 # Configuration constants grouped by category
 class Config:
     """Configuration constants for the monitor"""
     # Polling and logging
     POLL_INTERVAL_SECONDS = 0.5
+    IDLE_POLL_INTERVAL_MAX_SECONDS = 2.0  # Back off to this interval while no writes are active
+    IDLE_POLL_BACKOFF_FACTOR = 0.5  # Fraction of the base interval added per idle tick
     VERBOSE_LOG_INTERVAL = 100  # Log verbosely every N iterations
+    LOG_FLUSH_THRESHOLD_BYTES = 64 * 1024  # Flush buffered log lines once this much is queued
     
     # File transfer tracking
     TARGET_SIZE_EXPANSION_THRESHOLD = 1.1  # Expand target size if file exceeds by this factor
+    SPEED_SMOOTHING_SECONDS = 2.0  # Time constant of the speed moving average
+    MIN_SPEED_SAMPLE_SECONDS = 0.05  # Shorter gaps are folded into the next speed sample
+    MIN_DISPLAY_SPEED = 1.0  # Smoothed speeds below this (bytes/sec) count as stalled
     
     # UI dimensions
     MIN_PROGRESS_BAR_WIDTH = 40
@@ -122,13 +226,20 @@ class Config:
     UI_FOOTER_PADDING = 2  # Lines reserved for footer spacing
     
     # Cache limits
-    EPISODE_CACHE_MAX_SIZE = 1000  # Maximum entries in episode cache before clearing
+    EPISODE_CACHE_MAX_SIZE = 1000  # Maximum entries in extract_episode_info's LRU cache
     PATH_CACHE_MAX_SIZE = 500  # Maximum entries in path abbreviation cache
+    PROGRESS_BAR_CACHE_MAX_SIZE = 128  # Maximum entries in progress bar string cache
 
 class FileTransferInfo:
     """Tracks information about a file being written"""
+    __slots__ = ('fd', 'filepath', 'source_filepath', 'position', 'size', 'target_size',
+                 'initial_target', 'last_position', 'last_time', 'speed', 'first_seen')
+    
     def __init__(self, fd: str, filepath: str, position: int, size: int, 
-                 target_size: Optional[int] = None, source_filepath: Optional[str] = None):
+                 target_size: Optional[int] = None, source_filepath: Optional[str] = None,
+                 now: Optional[float] = None):
+        if now is None:
+            now = time.time()
         self.fd = fd
         self.filepath = filepath
         self.source_filepath = source_filepath  # Store the source file path
@@ -137,21 +248,33 @@ class FileTransferInfo:
         self.target_size = target_size if target_size is not None else size
         self.initial_target = self.target_size
         self.last_position = position
-        self.last_time = time.time()
+        self.last_time = now
         self.speed: float = 0
-        self.first_seen = time.time()
+        self.first_seen = now
+    
+    @classmethod
+    def from_write_file(cls, write_file: WriteFileInfo, now: Optional[float] = None) -> 'FileTransferInfo':
+        """Start tracking a file first seen in a scan
         
-    def update(self, size: int) -> None:
+        Args:
+            write_file: Scan snapshot of the file being written
+            now: Timestamp of the scan (defaults to the current time)
+        """
+        return cls(write_file.fd, write_file.filepath, write_file.size, write_file.size,
+                   write_file.target_size, write_file.source_filepath, now)
+    
+    def update(self, size: int, now: Optional[float] = None) -> None:
         """Update position, size, and calculate speed
         
         Args:
             size: Current file size in bytes
+            now: Timestamp of the scan (defaults to the current time)
         """
         # Validate inputs
         if size < 0:
             return  # Ignore invalid size
         
-        current_time = time.time()
+        current_time = time.time() if now is None else now
         time_delta = current_time - self.last_time
         
         actual_position = size
@@ -160,15 +283,28 @@ class FileTransferInfo:
         if actual_position > self.target_size * Config.TARGET_SIZE_EXPANSION_THRESHOLD:
             self._expand_target_size(actual_position)
         
-        # Calculate speed only if time has passed and bytes were written
-        if time_delta > 0:
-            bytes_written = actual_position - self.last_position
-            if bytes_written > 0:
-                self.speed = bytes_written / time_delta
-        
-        self.last_position = actual_position
         self.position = actual_position
         self.size = size
+        
+        # Samples too close together are noise; leave last_position/last_time
+        # alone so the bytes count towards the next sample instead
+        if time_delta < Config.MIN_SPEED_SAMPLE_SECONDS:
+            return
+        
+        # Exponentially weighted moving average of the write rate. The weight
+        # depends on the sample's duration, so the smoothing does not change
+        # with the poll interval, and a stalled write decays towards zero.
+        bytes_written = max(actual_position - self.last_position, 0)
+        sample_speed = bytes_written / time_delta
+        if self.speed == 0:
+            self.speed = sample_speed
+        else:
+            alpha = 1.0 - math.exp(-time_delta / Config.SPEED_SMOOTHING_SECONDS)
+            self.speed += alpha * (sample_speed - self.speed)
+            if self.speed < Config.MIN_DISPLAY_SPEED:
+                self.speed = 0
+        
+        self.last_position = actual_position
         self.last_time = current_time
     
     def _expand_target_size(self, new_size: int) -> None:
@@ -247,12 +383,13 @@ def format_time(seconds: Optional[float]) -> str:
     return f"{minutes}:{secs:02d}"
 
 # Compiled regex patterns for episode info extraction (compiled once at module level)
-EPISODE_PATTERNS = [
+EPISODE_PATTERNS = (
     re.compile(r'[Ss](\d+)[Ee](\d+)'),  # S01E05
     re.compile(r'(\d+)[xX](\d+)'),  # 1x05
     re.compile(r'[Ss]eason\s*(\d+).*[Ee]pisode\s*(\d+)'),  # Season 1 Episode 5
-]
+)
 
+@functools.lru_cache(maxsize=Config.EPISODE_CACHE_MAX_SIZE)
 def extract_episode_info(filename: str) -> Optional[Tuple[int, int]]:
     """Extract season/episode information from filename
     
@@ -261,70 +398,76 @@ def extract_episode_info(filename: str) -> Optional[Tuple[int, int]]:
     - 1x05 (alternate format)
     - Season 1 Episode 5 (verbose format)
     
+    Results are memoized in a bounded LRU cache keyed on the filename.
+    
     Returns:
         Tuple of (season, episode) as integers, or None if no match
     """
     for pattern in EPISODE_PATTERNS:
         match = pattern.search(filename)
         if match:
-            season = int(match.group(1))
-            episode = int(match.group(2))
-            return (season, episode)
+            return (int(match.group(1)), int(match.group(2)))
     
     return None
 
-def _match_by_exact_name(dest_filename: str, read_files: Dict[str, int]) -> Optional[int]:
+class ReadFileIndex(NamedTuple):
+    """Lookup tables over the files a process is reading, built once per scan"""
+    by_name: Dict[str, ReadFileInfo]  # lowercased filename -> ReadFileInfo
+    by_episode: Dict[Tuple[int, int], ReadFileInfo]  # (season, episode) -> ReadFileInfo
+    largest: Optional[ReadFileInfo]
+
+def build_read_file_index(read_files: Dict[str, ReadFileInfo]) -> ReadFileIndex:
+    """Index read files by lowercased name and by episode info
+    
+    The first file seen for a given name or episode wins, matching the
+    scan order of the previous linear search.
+    
+    Args:
+        read_files: Dict of {filename: ReadFileInfo}
+    
+    Returns:
+        ReadFileIndex for O(1) source matching
+    """
+    by_name: Dict[str, ReadFileInfo] = {}
+    by_episode: Dict[Tuple[int, int], ReadFileInfo] = {}
+    largest: Optional[ReadFileInfo] = None
+    for src_name, src_info in read_files.items():
+        by_name.setdefault(src_name.lower(), src_info)
+        src_ep = extract_episode_info(src_name)
+        if src_ep:
+            by_episode.setdefault(src_ep, src_info)
+        if largest is None or src_info.size > largest.size:
+            largest = src_info
+    return ReadFileIndex(by_name, by_episode, largest)
+
+def _match_by_exact_name(dest_filename: str, read_index: ReadFileIndex) -> Optional[ReadFileInfo]:
     """Try to match destination file by exact name (case-insensitive)
     
     Args:
         dest_filename: Destination filename to match
-        read_files: Dict of {filename: size}
+        read_index: Index of files being read
     
     Returns:
-        Size of matching source file, or None if no match
+        Matching source file info, or None if no match
     """
-    dest_lower = dest_filename.lower()
-    for src_name, src_size in read_files.items():
-        if src_name.lower() == dest_lower:
-            return src_size
-    return None
+    return read_index.by_name.get(dest_filename.lower())
 
-def _match_by_episode_pattern(dest_filename: str, read_files: Dict[str, int],
-                              episode_cache: Dict[str, Optional[Tuple[int, int]]]) -> Optional[int]:
+def _match_by_episode_pattern(dest_filename: str, read_index: ReadFileIndex) -> Optional[ReadFileInfo]:
     """Try to match destination file by episode pattern (S01E05, etc.)
     
     Args:
         dest_filename: Destination filename to match
-        read_files: Dict of {filename: size}
-        episode_cache: Dict to cache episode info extraction results
+        read_index: Index of files being read
     
     Returns:
-        Size of matching source file, or None if no match
+        Matching source file info, or None if no match
     """
-    # Get or compute episode info for destination
-    if dest_filename not in episode_cache:
-        if len(episode_cache) >= Config.EPISODE_CACHE_MAX_SIZE:
-            episode_cache.pop(next(iter(episode_cache)))
-        episode_cache[dest_filename] = extract_episode_info(dest_filename)
-    
-    dest_ep = episode_cache[dest_filename]
+    dest_ep = extract_episode_info(dest_filename)
     if not dest_ep:
         return None
-    
-    # Find source file with matching episode info
-    for src_name, src_size in read_files.items():
-        if src_name not in episode_cache:
-            if len(episode_cache) >= Config.EPISODE_CACHE_MAX_SIZE:
-                episode_cache.pop(next(iter(episode_cache)))
-            episode_cache[src_name] = extract_episode_info(src_name)
-        
-        if episode_cache[src_name] == dest_ep:
-            return src_size
-    
-    return None
+    return read_index.by_episode.get(dest_ep)
 
-def find_matching_source(dest_filename: str, read_files: Dict[str, int], 
-                        episode_cache: Dict[str, Optional[Tuple[int, int]]]) -> Optional[int]:
+def find_matching_source(dest_filename: str, read_index: ReadFileIndex) -> Optional[ReadFileInfo]:
     """Find the best matching source file for a destination
     
     Tries multiple matching strategies in order:
@@ -333,31 +476,56 @@ def find_matching_source(dest_filename: str, read_files: Dict[str, int],
     
     Args:
         dest_filename: Destination filename to match
-        read_files: Dict of {filename: size}
-        episode_cache: Dict to cache episode info extraction results
+        read_index: Index of files being read
     
     Returns:
-        Size of matching source file, or None if no match found
+        Matching source file info, or None if no match found
     """
     # Try exact match first (fastest)
-    exact_match = _match_by_exact_name(dest_filename, read_files)
+    exact_match = _match_by_exact_name(dest_filename, read_index)
     if exact_match is not None:
         return exact_match
     
     # Try episode pattern matching
-    return _match_by_episode_pattern(dest_filename, read_files, episode_cache)
+    return _match_by_episode_pattern(dest_filename, read_index)
 
-def abbreviate_path(path_str: str, max_width: int, cache: Optional[Dict[Tuple[str, int], str]] = None) -> str:
+def _char_display_width(char: str) -> int:
+    """Display width of a single character, counting non-printables as one column"""
+    width = wcwidth(char)
+    return width if width >= 0 else 1
+
+def _abbreviate_by_search(path_str: str, max_width: int) -> str:
+    """Find the longest '...'-prefixed suffix of path_str that fits max_width
+    
+    Measures each candidate with wcswidth, using its length when wcswidth
+    rejects it. Used for paths with non-printable characters or emoji
+    sequences, where a running sum of character widths would be wrong.
+    """
+    for i in range(len(path_str)):
+        truncated = "..." + path_str[i:]
+        try:
+            trunc_width = wcswidth(truncated)
+            if trunc_width < 0:
+                trunc_width = len(truncated)
+        except (TypeError, ValueError):
+            trunc_width = len(truncated)
+        if trunc_width <= max_width:
+            return truncated
+    return "..."
+
+@functools.lru_cache(maxsize=Config.PATH_CACHE_MAX_SIZE)
+def abbreviate_path(path_str: str, max_width: int) -> str:
     """Abbreviate a path to fit within max_width characters
     
     Automatically uses wcwidth library if available for proper double-width
     character support (CJK, emoji, etc.). Falls back to simple character
     counting for ASCII/Latin text.
     
+    Results are memoized in a bounded LRU cache keyed on (path_str, max_width).
+    
     Args:
         path_str: Path string to abbreviate
         max_width: Maximum display width in characters
-        cache: Optional cache dict for storing results to improve performance
     
     Returns:
         Abbreviated path string that fits within max_width
@@ -365,41 +533,51 @@ def abbreviate_path(path_str: str, max_width: int, cache: Optional[Dict[Tuple[st
     if max_width <= 0:
         return ""
     
-    # Check cache first if provided
-    if cache is not None:
-        cache_key = (path_str, max_width)
-        if cache_key in cache:
-            return cache[cache_key]
-    
     # Calculate abbreviated path
     if HAS_WCWIDTH:
-        # Use proper display width calculation
-        try:
-            actual_width = wcswidth(path_str)
-            if actual_width < 0:  # Contains non-printable characters
-                actual_width = len(path_str)
-        except (TypeError, ValueError):
-            # Fallback if wcswidth fails on unexpected input
+        # ASCII is always one column per character, so skip wcwidth's per-character work
+        is_ascii = path_str.isascii()
+        printable = True
+        if is_ascii:
             actual_width = len(path_str)
+        else:
+            # Use proper display width calculation
+            try:
+                actual_width = wcswidth(path_str)
+                if actual_width < 0:  # Contains non-printable characters
+                    actual_width = len(path_str)
+                    printable = False
+            except (TypeError, ValueError):
+                # Fallback if wcswidth fails on unexpected input
+                actual_width = len(path_str)
+                printable = False
         
         if actual_width <= max_width:
             result = path_str
         elif max_width <= 3:
             result = "..."[:max_width]
+        elif is_ascii:
+            result = "..." + path_str[-(max_width-3):]
+        elif not printable:
+            # Suffixes are measured as a whole, falling back to their length
+            # whenever they contain a non-printable character; that width is
+            # not a running sum, so search linearly as before
+            result = _abbreviate_by_search(path_str, max_width)
         else:
-            # Try to show the end of the path (filename is most important)
-            result = "..."
-            for i in range(len(path_str)):
-                truncated = "..." + path_str[i:]
-                try:
-                    trunc_width = wcswidth(truncated)
-                    if trunc_width < 0:
-                        trunc_width = len(truncated)
-                except (TypeError, ValueError):
-                    trunc_width = len(truncated)
-                if trunc_width <= max_width:
-                    result = truncated
-                    break
+            # Try to show the end of the path (filename is most important).
+            # Cumulative display widths are non-decreasing, so the earliest
+            # start index whose suffix fits is found by bisection. wcswidth
+            # measures ZWJ and VS16 emoji sequences as a whole, so a suffix's
+            # width is only a running sum when neither appears; otherwise, or
+            # if the sum still disagrees with wcswidth, search linearly.
+            prefix_widths = list(itertools.accumulate(
+                (_char_display_width(c) for c in path_str), initial=0))
+            if (prefix_widths[-1] == actual_width
+                    and '\u200d' not in path_str and '\ufe0f' not in path_str):
+                start = bisect.bisect_left(prefix_widths, prefix_widths[-1] - (max_width - 3))
+                result = "..." + path_str[start:]
+            else:
+                result = _abbreviate_by_search(path_str, max_width)
     else:
         # Fallback: simple character counting (works for ASCII/Latin)
         if len(path_str) <= max_width:
@@ -409,56 +587,151 @@ def abbreviate_path(path_str: str, max_width: int, cache: Optional[Dict[Tuple[st
         else:
             result = path_str[:max_width]
     
-    # Store in cache with size limit if cache provided
-    if cache is not None:
-        cache_key = (path_str, max_width)
-        if len(cache) >= Config.PATH_CACHE_MAX_SIZE:
-            # Remove oldest entry (first key)
-            cache.pop(next(iter(cache)))
-        cache[cache_key] = result
-    
     return result
 
 def should_ignore_file(filepath: str) -> bool:
-    """Check if file should be ignored"""
-    path = Path(filepath)
-    return path.suffix.lower() in IGNORE_EXTENSIONS
+    """Check if file should be ignored
+    
+    Uses plain string slicing with the same suffix rules as Path.suffix
+    (last dot in the final component, leading dot does not count).
+    """
+    name = filepath[filepath.rfind('/') + 1:]
+    dot = name.rfind('.')
+    return dot > 0 and name[dot:].lower() in IGNORE_EXTENSIONS
+
+def _read_comm(pid: int) -> Optional[bytes]:
+    """Read the raw command name from /proc/<pid>/comm
+    
+    One open and one read; a missing process shows up as a failed open, so
+    this doubles as an existence check.
+    
+    Args:
+        pid: Process ID to look up
+    
+    Returns:
+        Command name bytes without the trailing newline, or None if the
+        process does not exist
+    """
+    try:
+        comm_fd = os.open(f"/proc/{pid}/comm", os.O_RDONLY)
+        try:
+            data = os.read(comm_fd, 64)
+        finally:
+            os.close(comm_fd)
+    except OSError:
+        return None
+    return data.rstrip(b'\n')
+
+def read_process_name(pid: int) -> Optional[str]:
+    """Read a process's command name from /proc/<pid>/comm
+    
+    Args:
+        pid: Process ID to look up
+    
+    Returns:
+        Process name, or None if the process does not exist
+    """
+    comm = _read_comm(pid)
+    if comm is None:
+        return None
+    return comm.decode(errors='replace')
 
 def find_arr_processes() -> List[Tuple[int, str]]:
-    """Find all running *arr manager processes"""
+    """Find all running *arr manager processes
+    
+    Scans /proc directly and reads only each process's comm name, which is
+    all that is needed to match against ARR_MANAGERS.
+    """
     found = []
-    for proc in psutil.process_iter(['pid', 'name']):
-        try:
-            name = proc.info['name']
-            if name in ARR_MANAGERS:
-                found.append((proc.info['pid'], name))
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            pass
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        pid = int(entry)
+        comm = _read_comm(pid)
+        if comm in ARR_MANAGER_COMMS:
+            found.append((pid, comm.decode('ascii')))
+    found.sort()
     return found
 
-def _parse_fdinfo_flags(fdinfo_path: Path, verbose_log: bool = False) -> Optional[int]:
-    """Parse file descriptor flags from fdinfo file
+def _parse_fdinfo(fdinfo_path: str, dir_fd: Optional[int] = None) -> Optional[Tuple[int, int]]:
+    """Parse file descriptor flags and position from fdinfo file
     
-    Extracted for testability - reads fdinfo and returns the flags value.
+    Extracted for testability - reads the whole fdinfo entry with a single
+    open/read/close and slices flags and position out of the leading lines.
     
     Args:
-        fdinfo_path: Path to the fdinfo file
-        verbose_log: Whether to parse position for verbose logging
+        fdinfo_path: Path to the fdinfo file, relative to dir_fd if given
+        dir_fd: Optional open /proc/<pid>/fdinfo directory descriptor
     
     Returns:
-        File flags as integer, or None if parsing failed
+        Tuple of (flags, position), or None if parsing failed
     """
     try:
-        with open(fdinfo_path, 'r') as f:
-            for line in f:
-                if line.startswith('flags:'):
-                    return int(line.split()[1], 8)
+        fdinfo_fd = os.open(fdinfo_path, os.O_RDONLY, dir_fd=dir_fd)
+        try:
+            data = os.read(fdinfo_fd, FDINFO_READ_SIZE)
+        finally:
+            os.close(fdinfo_fd)
+    except OSError:
         return None
-    except (OSError, ValueError, IndexError):
+    
+    # The kernel always emits "pos:" then "flags:" as the first two lines, so
+    # parse them in place and only fall back to the regex for anything else
+    pos_line, _, rest = data.partition(b'\n')
+    flags_line, _, _ = rest.partition(b'\n')
+    if pos_line.startswith(b'pos:') and flags_line.startswith(b'flags:'):
+        try:
+            return (int(flags_line[6:], 8), int(pos_line[4:]))
+        except ValueError:
+            return None
+    
+    match = FDINFO_PATTERN.search(data)
+    if match is None:
         return None
+    return (int(match.group(2), 8), int(match.group(1)))
+
+# /proc/<pid>/fd and /proc/<pid>/fdinfo directory fds, kept open across scans.
+# The handles stay bound to the original process, so a recycled PID can never
+# be read through them; lookups fail with ENOENT once the process has exited.
+_proc_dir_fds: Dict[int, Tuple[int, int]] = {}
+
+def _open_proc_dirs(pid: int) -> Tuple[int, int]:
+    """Return (fd_dir_fd, fdinfo_dir_fd) for a PID, opening them on first use"""
+    dir_fds = _proc_dir_fds.get(pid)
+    if dir_fds is None:
+        flags = os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC
+        # Resolve /proc/<pid> once and open both children relative to it
+        proc_dir_fd = os.open(f"/proc/{pid}", os.O_PATH | os.O_DIRECTORY | os.O_CLOEXEC)
+        try:
+            fd_dir_fd = os.open("fd", flags, dir_fd=proc_dir_fd)
+            try:
+                fdinfo_dir_fd = os.open("fdinfo", flags, dir_fd=proc_dir_fd)
+            except OSError:
+                os.close(fd_dir_fd)
+                raise
+        finally:
+            os.close(proc_dir_fd)
+        dir_fds = _proc_dir_fds[pid] = (fd_dir_fd, fdinfo_dir_fd)
+    return dir_fds
+
+# Per-PID fdinfo flags of read-mode fds, keyed by (fd, st_dev, st_ino) and
+# stored with the file's size and mtime. A process can close an fd and reopen
+# the same file for writing under the same number, so a cached entry is only
+# trusted while the file is unchanged; any write to it forces a fresh fdinfo
+# read. Each scan replaces the PID's dict, dropping closed fds.
+_fd_flags_cache: Dict[int, Dict[Tuple[str, int, int], Tuple[int, int, int]]] = {}
+
+def close_proc_dirs(pid: int) -> None:
+    """Close the cached /proc directory fds for a PID and drop its fd state"""
+    _fd_flags_cache.pop(pid, None)
+    for dir_fd in _proc_dir_fds.pop(pid, ()):
+        try:
+            os.close(dir_fd)
+        except OSError:
+            pass
 
-def _determine_target_size(filename: str, file_size: int, read_files: Dict[str, ReadFileInfo],
-                          episode_cache: Dict[str, Optional[Tuple[int, int]]]) -> Tuple[int, Optional[str], str]:
+def _determine_target_size(filename: str, file_size: int,
+                          read_index: ReadFileIndex) -> Tuple[int, Optional[str], str]:
     """Determine target size and source path for a destination file
     
     Extracted for testability - implements the matching logic without file I/O.
@@ -466,174 +739,192 @@ def _determine_target_size(filename: str, file_size: int, read_files: Dict[str,
     Args:
         filename: Destination filename
         file_size: Current size of destination file
-        read_files: Dictionary of source files being read
-        episode_cache: Cache for episode pattern matching
+        read_index: Index of source files being read
     
     Returns:
         Tuple of (target_size, source_path, match_method) where target_size is always >= 1
     """
-    # Convert read_files to simple dict for matching
-    read_files_sizes = {name: info.size for name, info in read_files.items()}
-    match_result = find_matching_source(filename, read_files_sizes, episode_cache)
+    match = find_matching_source(filename, read_index)
     
-    if match_result is not None:
+    if match is not None:
         # Found exact or pattern match
-        for src_name, src_info in read_files.items():
-            if src_info.size == match_result:
-                return (match_result, src_info.path, "pattern/exact")
-        # Shouldn't happen, but fallback
-        return (match_result, None, "pattern/exact")
-    elif read_files:
+        return (match.size, match.path, "pattern/exact")
+    elif read_index.largest is not None:
         # Fallback to largest read file
-        largest_info = max(read_files.values(), key=lambda x: x.size)
-        return (largest_info.size, largest_info.path, "largest")
+        return (read_index.largest.size, read_index.largest.path, "largest")
     else:
         # No read files, use current file size
         return (max(file_size, 1), None, "fallback")
 
 def get_open_files(pid: int, logger: Optional[DebugLogger] = None, 
-                  verbose_log: bool = False, 
-                  episode_cache: Optional[Dict[str, Optional[Tuple[int, int]]]] = None) -> Dict[str, FileTransferInfo]:
+                  verbose_log: bool = False,
+                  known_keys: Optional[Set[str]] = None) -> Optional[Dict[str, WriteFileInfo]]:
     """Get files currently being written by the process
     
+    Returns None once the process has exited, so callers need no separate
+    liveness check; other scan errors yield an empty dict.
+    
     Args:
         pid: Process ID to scan
         logger: Optional DebugLogger instance
         verbose_log: Enable verbose debug logging
-        episode_cache: Optional dict to cache episode info extraction
+        known_keys: Keys of writes already being tracked. Their target size and
+            source were fixed when first seen, so source matching is skipped
+            and their entries carry only the current size (target_size=size,
+            source_filepath=None).
     """
-    if episode_cache is None:
-        episode_cache = {}
-    
-    open_files: Dict[str, FileTransferInfo] = {}
+    open_files: Dict[str, WriteFileInfo] = {}
     read_files: Dict[str, ReadFileInfo] = {}  # filename -> ReadFileInfo
+    write_files: List[Tuple[str, str, int]] = []  # (fd, filepath, size)
+    known_flags = _fd_flags_cache.get(pid, {})
+    seen_flags: Dict[Tuple[str, int, int], Tuple[int, int, int]] = {}
     
     if verbose_log and logger:
         logger.log(f"=== VERBOSE SCAN of PID {pid} ===")
     
     try:
-        fd_dir = Path(f"/proc/{pid}/fd")
-        fdinfo_dir = Path(f"/proc/{pid}/fdinfo")
+        fd_dir_fd, fdinfo_dir_fd = _open_proc_dirs(pid)
         
-        if not fd_dir.exists() or not fdinfo_dir.exists():
-            if verbose_log and logger:
-                logger.log(f"  /proc/{pid}/fd or fdinfo does not exist")
-            return {}
-        
-        # Single pass: collect all FD info and categorize immediately
-        for fd_link in fd_dir.iterdir():
-            fd = fd_link.name
-            try:
-                # Check fdinfo exists early before expensive operations
-                fdinfo_path = fdinfo_dir / fd
-                if not fdinfo_path.exists():
-                    if verbose_log and logger:
-                        logger.log(f"  FD {fd}: Skipped - no fdinfo")
-                    continue
-                
-                # Resolve symlink with early error handling
+        # Every per-FD stat, readlink and fdinfo open below is relative to the
+        # cached directory fds instead of a full path walk. Closing the scandir
+        # iterator rewinds fd_dir_fd for the next scan.
+        with os.scandir(fd_dir_fd) as fd_entries:
+            # Single pass: collect all FD info and categorize immediately
+            for entry in fd_entries:
+                fd = entry.name
                 try:
-                    filepath = fd_link.resolve()
-                    # Validate that resolved path is absolute
-                    if not filepath.is_absolute():
+                    # Stat through the fd's magic link: no path walk of the target,
+                    # and sockets, pipes and anon inodes are rejected before readlink
+                    try:
+                        stat_info = os.stat(fd, dir_fd=fd_dir_fd)
+                    except OSError as e:
                         if verbose_log and logger:
-                            logger.log(f"  FD {fd}: Skipped - non-absolute path: {filepath}")
+                            logger.log(f"  FD {fd}: Skipped - could not stat: {e}")
                         continue
-                    # Check for suspicious path traversal patterns
-                    if '..' in filepath.parts:
+                    if not stat.S_ISREG(stat_info.st_mode):
                         if verbose_log and logger:
-                            logger.log(f"  FD {fd}: Skipped - path contains traversal: {filepath}")
+                            logger.log(f"  FD {fd}: Skipped - not a regular file")
                         continue
-                except (OSError, RuntimeError) as e:
-                    if verbose_log and logger:
-                        logger.log(f"  FD {fd}: Skipped - could not resolve: {e}")
-                    continue
-                
-                if verbose_log and logger:
-                    logger.log(f"  FD {fd}: {filepath}")
-                
-                # Check if regular file and get size - combined to reduce syscalls
-                try:
-                    stat_info = filepath.stat()
-                    if not filepath.is_file():
+                    if stat_info.st_nlink == 0:
                         if verbose_log and logger:
-                            logger.log(f"    Skipped: not a regular file")
+                            logger.log(f"  FD {fd}: Skipped - file has been deleted")
                         continue
-                    file_size = stat_info.st_size
-                except (OSError, FileNotFoundError) as e:
-                    if verbose_log and logger:
-                        logger.log(f"    Skipped: could not stat - {e}")
-                    continue
-                
-                # Read fdinfo to get file flags
-                flags = _parse_fdinfo_flags(fdinfo_path, verbose_log)
-                if flags is None:
-                    if verbose_log and logger:
-                        logger.log(f"    Skipped: could not read fdinfo flags")
-                    continue
-                
-                # Parse position only for verbose logging
-                position = 0
-                if verbose_log:
+                    
+                    # Read the link target directly; /proc fd links are already canonical
                     try:
-                        with open(fdinfo_path, 'r') as f:
-                            for line in f:
-                                if line.startswith('pos:'):
-                                    position = int(line.split()[1])
-                                    break
-                    except (OSError, ValueError, IndexError):
-                        pass  # Position is only for logging, not critical
-                
-                # Extract access mode from flags (O_RDONLY=0, O_WRONLY=1, O_RDWR=2)
-                access_mode = flags & ACCESS_MODE_MASK
-                
-                if verbose_log and logger:
-                    logger.log(f"    size={file_size} pos={position} flags={oct(flags)} mode={access_mode}")
-                
-                # Categorize immediately
-                if access_mode == ACCESS_MODE_READ:
-                    # Read file
-                    filename = filepath.name
-                    read_files[filename] = ReadFileInfo(size=file_size, path=str(filepath))
-                    if verbose_log and logger:
-                        logger.log(f"  Read file: {filename} ({file_size} bytes)")
-                
-                elif access_mode in (ACCESS_MODE_WRITE, ACCESS_MODE_READWRITE):
-                    # Write file - check if should be ignored
-                    if should_ignore_file(str(filepath)):
+                        filepath = os.readlink(fd, dir_fd=fd_dir_fd)
+                        # Validate that the target is an absolute path
+                        if not filepath.startswith('/'):
+                            if verbose_log and logger:
+                                logger.log(f"  FD {fd}: Skipped - non-absolute path: {filepath}")
+                            continue
+                        # Check for suspicious path traversal patterns
+                        if '..' in filepath.split('/'):
+                            if verbose_log and logger:
+                                logger.log(f"  FD {fd}: Skipped - path contains traversal: {filepath}")
+                            continue
+                    except OSError as e:
                         if verbose_log and logger:
-                            logger.log(f"    Skipped: ignored extension")
+                            logger.log(f"  FD {fd}: Skipped - could not resolve: {e}")
                         continue
                     
-                    filename = filepath.name
-                    current_pos = file_size
+                    if verbose_log and logger:
+                        logger.log(f"  FD {fd}: {filepath}")
                     
-                    # Determine target size and source using extracted helper function
-                    target_size, source_path, match_method = _determine_target_size(
-                        filename, file_size, read_files, episode_cache
-                    )
+                    # Skip fdinfo for a read-mode fd whose file has not changed
+                    # since the last scan. Write fds, new fds, files that moved
+                    # (the fd may have been reopened for writing) and verbose
+                    # scans that want the current position always re-read it.
+                    flags_key = (fd, stat_info.st_dev, stat_info.st_ino)
+                    file_state = (stat_info.st_size, stat_info.st_mtime_ns)
+                    cached = known_flags.get(flags_key)
+                    position = None  # Only known when fdinfo is read
+                    if cached is not None and cached[1:] == file_state and not verbose_log:
+                        flags = cached[0]
+                    else:
+                        fdinfo = _parse_fdinfo(fd, fdinfo_dir_fd)
+                        if fdinfo is None:
+                            if verbose_log and logger:
+                                logger.log(f"    Skipped: could not read fdinfo")
+                            continue
+                        flags, position = fdinfo
+                    if flags & ACCESS_MODE_MASK == ACCESS_MODE_READ:
+                        seen_flags[flags_key] = (flags,) + file_state
                     
-                    matched_source = os.path.basename(source_path) if source_path else "none"
+                    # Extract access mode from flags (O_RDONLY=0, O_WRONLY=1, O_RDWR=2)
+                    access_mode = flags & ACCESS_MODE_MASK
+                    is_write = access_mode in (ACCESS_MODE_WRITE, ACCESS_MODE_READWRITE)
+                    
+                    if access_mode != ACCESS_MODE_READ and not is_write:
+                        if verbose_log and logger:
+                            logger.log(f"    Skipped: unknown access mode {access_mode}")
+                        continue
+                    if is_write and should_ignore_file(filepath):
+                        if verbose_log and logger:
+                            logger.log(f"    Skipped: ignored extension")
+                        continue
+                    
+                    file_size = stat_info.st_size
                     
                     if verbose_log and logger:
-                        logger.log(f"  Write file: {filename}")
-                        logger.log(f"    current={file_size} target={target_size} match={match_method} source={matched_source}")
+                        logger.log(f"    size={file_size} pos={position} flags={oct(flags)} mode={access_mode}")
                     
-                    key = f"{fd}_{filepath}"
-                    open_files[key] = FileTransferInfo(fd, str(filepath), current_pos, file_size, target_size, source_path)
-            
-            except (PermissionError, OSError) as e:
-                if verbose_log and logger:
-                    logger.log(f"  FD {fd_link.name}: Error - {e}")
+                    # Categorize immediately
+                    if is_write:
+                        # Defer matching until every read file has been seen
+                        write_files.append((fd, filepath, file_size))
+                    else:
+                        # Read file
+                        filename = os.path.basename(filepath)
+                        read_files[filename] = ReadFileInfo(size=file_size, path=filepath)
+                        if verbose_log and logger:
+                            logger.log(f"  Read file: {filename} ({file_size} bytes)")
+                
+                except (PermissionError, OSError) as e:
+                    if verbose_log and logger:
+                        logger.log(f"  FD {fd}: Error - {e}")
+                    continue
+        
+        _fd_flags_cache[pid] = seen_flags
+        
+        # Match new destinations against sources in one pass over the indexed
+        # reads; the index is only built if some write actually needs it
+        read_index = None
+        for fd, filepath_str, file_size in write_files:
+            key = f"{fd}_{filepath_str}"
+            if known_keys and key in known_keys and not verbose_log:
+                open_files[key] = WriteFileInfo(fd, filepath_str, file_size, file_size, None)
                 continue
+            if read_index is None:
+                read_index = build_read_file_index(read_files)
+            filename = os.path.basename(filepath_str)
+            
+            # Determine target size and source using extracted helper function
+            target_size, source_path, match_method = _determine_target_size(
+                filename, file_size, read_index
+            )
+            
+            if verbose_log and logger:
+                matched_source = os.path.basename(source_path) if source_path else "none"
+                logger.log(f"  Write file: {filename}")
+                logger.log(f"    current={file_size} target={target_size} match={match_method} source={matched_source}")
+            
+            open_files[key] = WriteFileInfo(fd, filepath_str, file_size, target_size, source_path)
         
         if verbose_log and logger:
             logger.log(f"  Result: {len(open_files)} writable files, {len(read_files)} read files")
         return open_files
     
+    except FileNotFoundError:
+        # /proc/<pid> is gone, or the cached directory fds outlived the process
+        if verbose_log and logger:
+            logger.log(f"  /proc/{pid}/fd does not exist")
+        close_proc_dirs(pid)
+        return None
     except (PermissionError, OSError) as e:
         if verbose_log and logger:
             logger.log(f"  Error scanning PID {pid}: {e}")
+        close_proc_dirs(pid)
         return {}
 
 def select_process_interactive() -> Optional[List[int]]:
@@ -669,26 +960,78 @@ def select_process_interactive() -> Optional[List[int]]:
         except (ValueError, KeyboardInterrupt):
             return None
 
-def draw_ui(stdscr: CursesWindow, pid_list: List[int], tracked_files: Dict[Tuple[int, str], FileTransferInfo], 
-           path_cache: Optional[Dict[Tuple[str, int], str]] = None,
-           proc_name_cache: Optional[Dict[int, str]] = None) -> None:
+def get_process_name(pid: int, proc_name_cache: Dict[int, str]) -> str:
+    """Get a process name, looking it up only the first time a PID is seen
+    
+    Args:
+        pid: Process ID to name
+        proc_name_cache: Cache of pid -> name kept for the monitor's lifetime
+    
+    Returns:
+        Process name, or "PID <pid>" if it cannot be determined
+    """
+    name = proc_name_cache.get(pid)
+    if name is None:
+        name = read_process_name(pid) or f"PID {pid}"
+        proc_name_cache[pid] = name
+    return name
+
+@functools.lru_cache(maxsize=Config.PROGRESS_BAR_CACHE_MAX_SIZE)
+def _progress_bar(filled: int, bar_width: int) -> str:
+    """Return the bar body with filled of bar_width cells shaded"""
+    return "█" * filled + "░" * (bar_width - filled)
+
+@functools.lru_cache(maxsize=1)
+def _clock_label(second: int) -> str:
+    """Return the header clock line for a Unix timestamp in whole seconds"""
+    return f"Time: {time.strftime('%H:%M:%S', time.localtime(second))}"
+
+@functools.lru_cache(maxsize=8)
+def _rule_line(width: int) -> str:
+    """Return the horizontal rule under the header for a terminal width"""
+    return "─" * min(width - 1, 80)
+
+class ScreenBuffer:
+    """Off-screen pad plus a shadow copy of the rows last drawn by draw_ui
+    
+    Frames are composed on the pad and pushed to the terminal with a single
+    pad refresh, so stdscr never shows a partially drawn frame.
+    """
+    def __init__(self):
+        self.size: Tuple[int, int] = (0, 0)
+        self.pad: Optional[CursesWindow] = None
+        self.rows: Dict[int, List[Tuple[int, str, int]]] = {}  # row -> [(col, text, attr)]
+    
+    def invalidate(self) -> None:
+        """Force the next frame to repaint every row"""
+        self.size = (0, 0)
+        self.pad = None
+        self.rows.clear()
+
+def draw_ui(stdscr: CursesWindow, pid_list: List[int], tracked_rows: List[Tuple[int, FileTransferInfo]], 
+           proc_name_cache: Optional[Dict[int, str]] = None,
+           screen: Optional[ScreenBuffer] = None) -> None:
     """Draw the curses UI with file transfer progress
     
     Renders a terminal UI showing active file transfers with progress bars,
     transfer speeds, ETAs, and source/destination paths. Handles terminal
     resize gracefully and uses caching for performance.
     
+    The frame is composed in memory first and only rows that differ from
+    the previous frame are rewritten on the off-screen pad, which is then
+    copied to the terminal in one refresh.
+    
     Args:
         stdscr: Curses screen object for rendering
         pid_list: List of process IDs being monitored
-        tracked_files: Dictionary mapping (pid, file_key) to FileTransferInfo
-        path_cache: Optional cache for abbreviated paths to improve render performance
-        proc_name_cache: Optional cache for process names to avoid repeated psutil calls
+        tracked_rows: (pid, FileTransferInfo) pairs in display order
+        proc_name_cache: Optional cache for process names to avoid repeated /proc reads
+        screen: Optional ScreenBuffer holding the previous frame for differential redraw
     """
-    if path_cache is None:
-        path_cache = {}
     if proc_name_cache is None:
         proc_name_cache = {}
+    if screen is None:
+        screen = ScreenBuffer()
     
     try:
         height, width = stdscr.getmaxyx()
@@ -700,96 +1043,133 @@ def draw_ui(stdscr: CursesWindow, pid_list: List[int], tracked_files: Dict[Tuple
     if height < Config.MIN_TERMINAL_HEIGHT or width < Config.MIN_TERMINAL_WIDTH:
         return
     
-    try:
-        stdscr.erase()
-        
-        if len(pid_list) == 1:
-            pid = pid_list[0]
-            if pid not in proc_name_cache:
-                try:
-                    proc = psutil.Process(pid)
-                    proc_name_cache[pid] = proc.name()
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    proc_name_cache[pid] = f"PID {pid}"
-            proc_name = f"{proc_name_cache[pid]} (PID: {pid})"
-        else:
-            proc_name = f"Monitoring {len(pid_list)} processes"
+    frame: Dict[int, List[Tuple[int, str, int]]] = {}
+    
+    def put(row: int, col: int, text: str, attr: int) -> None:
+        frame.setdefault(row, []).append((col, text, attr))
+    
+    if len(pid_list) == 1:
+        pid = pid_list[0]
+        proc_name = f"{get_process_name(pid, proc_name_cache)} (PID: {pid})"
+    else:
+        proc_name = f"Monitoring {len(pid_list)} processes"
+    
+    header = f"*arr File Transfer Monitor - {proc_name}"
+    put(0, 0, header[:width-1], curses.A_BOLD | curses.color_pair(1))
+    put(1, 0, _clock_label(int(time.time())), curses.color_pair(2))
+    put(2, 0, _rule_line(width), curses.A_NORMAL)
+    
+    if not tracked_rows:
+        put(4, 0, "No active file writes detected...", curses.color_pair(3))
+    
+    row = 4
+    for pid, file_info in tracked_rows:
+        if row >= height - Config.UI_BOTTOM_PADDING:
+            break
         
-        header = f"*arr File Transfer Monitor - {proc_name}"
-        stdscr.addstr(0, 0, header[:width-1], curses.A_BOLD | curses.color_pair(1))
-        stdscr.addstr(1, 0, f"Time: {datetime.now().strftime('%H:%M:%S')}", curses.color_pair(2))
-        stdscr.addstr(2, 0, "─" * min(width - 1, 80))
+        # Use cached process name
+        proc_name = get_process_name(pid, proc_name_cache)
         
-        if not tracked_files:
-            stdscr.addstr(4, 0, "No active file writes detected...", curses.color_pair(3))
-            stdscr.addstr(height - 1, 0, "Press 'q' to quit", curses.color_pair(2))
-            stdscr.noutrefresh()
-            curses.doupdate()
-            return
+        # Green line: [ProcessName] filename
+        filename = os.path.basename(file_info.filepath)
+        header = f"[{proc_name}] {filename}"
+        put(row, 0, header[:width-1], curses.A_BOLD | curses.color_pair(4))  # Green
+        row += 1
         
-        row = 4
-        for (pid, file_key), file_info in tracked_files.items():
-            if row >= height - Config.UI_BOTTOM_PADDING:
-                break
-            
-            # Use cached process name
-            if pid not in proc_name_cache:
-                try:
-                    proc = psutil.Process(pid)
-                    proc_name_cache[pid] = proc.name()
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    proc_name_cache[pid] = f"PID {pid}"
-            proc_name = proc_name_cache[pid]
-            
-            # Green line: [ProcessName] filename
-            filename = os.path.basename(file_info.filepath)
-            header = f"[{proc_name}] {filename}"
-            stdscr.addstr(row, 0, header[:width-1], curses.A_BOLD | curses.color_pair(4))  # Green
-            row += 1
-            
-            # Red line: source path (indented)
-            if file_info.source_filepath:
-                indent = " " * Config.PATH_INDENT
-                source_display = indent + abbreviate_path(file_info.source_filepath, width - Config.PATH_WIDTH_OFFSET, path_cache)
-                stdscr.addstr(row, 0, source_display[:width-1], curses.color_pair(8))  # Red
-                row += 1
-            
-            # Blue line: destination path (indented)
+        # Red line: source path (indented)
+        if file_info.source_filepath:
             indent = " " * Config.PATH_INDENT
-            dest_display = indent + abbreviate_path(file_info.filepath, width - Config.PATH_WIDTH_OFFSET, path_cache)
-            stdscr.addstr(row, 0, dest_display[:width-1], curses.color_pair(5))  # Blue
-            row += 1
-            
-            bar_width = min(Config.MIN_PROGRESS_BAR_WIDTH, width - Config.PROGRESS_BAR_PADDING)
-            if bar_width > 0:
-                filled = int((file_info.percent / 100) * bar_width)
-                bar = "█" * filled + "░" * (bar_width - filled)
-                progress_str = f"  [{bar}] {file_info.percent:.1f}%"
-                stdscr.addstr(row, 0, progress_str[:width-1], curses.color_pair(6))
+            source_display = indent + abbreviate_path(file_info.source_filepath, width - Config.PATH_WIDTH_OFFSET)
+            put(row, 0, source_display[:width-1], curses.color_pair(8))  # Red
             row += 1
-            
-            size_str = f"  {format_size(file_info.position)} / {format_size(file_info.target_size)}"
-            stdscr.addstr(row, 0, size_str[:width-1], curses.color_pair(2))
-            
-            if file_info.speed > 0:
-                speed_str = f"  Speed: {format_speed(file_info.speed)}"
-                eta_str = f"  ETA: {format_time(file_info.eta_seconds)}"
-                info = speed_str + eta_str
-                if len(size_str) + len(info) < width - 1:
-                    stdscr.addstr(row, len(size_str), info[:width-1-len(size_str)], curses.color_pair(7))
-            
-            row += Config.UI_FOOTER_PADDING
-            
-            if row >= height - Config.UI_FOOTER_PADDING:
-                break
         
-        stdscr.addstr(height - 1, 0, "Press 'q' to quit"[:width-1], curses.color_pair(2))
+        # Blue line: destination path (indented)
+        indent = " " * Config.PATH_INDENT
+        dest_display = indent + abbreviate_path(file_info.filepath, width - Config.PATH_WIDTH_OFFSET)
+        put(row, 0, dest_display[:width-1], curses.color_pair(5))  # Blue
+        row += 1
+        
+        bar_width = min(Config.MIN_PROGRESS_BAR_WIDTH, width - Config.PROGRESS_BAR_PADDING)
+        if bar_width > 0:
+            percent = file_info.percent
+            filled = int((percent / 100) * bar_width)
+            bar = _progress_bar(filled, bar_width)
+            progress_str = f"  [{bar}] {percent:.1f}%"
+            put(row, 0, progress_str[:width-1], curses.color_pair(6))
+        row += 1
+        
+        size_str = f"  {format_size(file_info.position)} / {format_size(file_info.target_size)}"
+        put(row, 0, size_str[:width-1], curses.color_pair(2))
+        
+        if file_info.speed > 0:
+            speed_str = f"  Speed: {format_speed(file_info.speed)}"
+            eta_str = f"  ETA: {format_time(file_info.eta_seconds)}"
+            info = speed_str + eta_str
+            if len(size_str) + len(info) < width - 1:
+                put(row, len(size_str), info[:width-1-len(size_str)], curses.color_pair(7))
+        
+        row += Config.UI_FOOTER_PADDING
+        
+        if row >= height - Config.UI_FOOTER_PADDING:
+            break
+    
+    put(height - 1, 0, "Press 'q' to quit"[:width-1], curses.color_pair(2))
+    
+    try:
+        # Full repaint on a fresh pad after a resize, since the old shadow no longer
+        # matches the window. stdscr is blanked and marked clean so a later getch()
+        # does not refresh it over the pad.
+        if screen.pad is None or screen.size != (height, width):
+            stdscr.erase()
+            stdscr.noutrefresh()
+            screen.pad = curses.newpad(height, width)
+            screen.rows.clear()
+            screen.size = (height, width)
+        pad = screen.pad
+        
+        for row, segments in frame.items():
+            if screen.rows.get(row) != segments:
+                pad.move(row, 0)
+                pad.clrtoeol()
+                for col, text, attr in segments:
+                    pad.addstr(row, col, text, attr)
+        
+        # Blank rows that were drawn last frame but are empty now
+        for row in screen.rows.keys() - frame.keys():
+            pad.move(row, 0)
+            pad.clrtoeol()
         
-        stdscr.noutrefresh()
+        screen.rows = frame
+        pad.noutrefresh(0, 0, 0, 0, height - 1, width - 1)
         curses.doupdate()
     except curses.error:
         # Silently handle curses errors during rendering (e.g., terminal resize)
-        pass
+        # and repaint everything next time since the screen state is unknown
+        screen.invalidate()
+
+def _display_order(tracked_files: Dict[Tuple[int, str], FileTransferInfo]) -> List[Tuple[int, FileTransferInfo]]:
+    """Sort tracked files into a stable display order
+    
+    Args:
+        tracked_files: Dictionary mapping (pid, file_key) to FileTransferInfo
+    
+    Returns:
+        (pid, FileTransferInfo) pairs ordered by PID, file path, then FD
+    """
+    return sorted(((pid, info) for (pid, _), info in tracked_files.items()),
+                  key=lambda row: (row[0], row[1].filepath, int(row[1].fd)))
+
+def _render_fingerprint(tracked_rows: List[Tuple[int, FileTransferInfo]]) -> Tuple:
+    """Summarize the displayed state of tracked files for change detection
+    
+    Args:
+        tracked_rows: (pid, FileTransferInfo) pairs in display order
+    
+    Returns:
+        Tuple that compares equal whenever draw_ui would render the same file rows
+    """
+    return tuple((pid, info.fd, info.filepath, info.position, info.target_size, int(info.speed))
+                 for pid, info in tracked_rows)
 
 def run_monitor(stdscr: CursesWindow, pid_list: List[int], logger: Optional[DebugLogger] = None) -> None:
     """Main monitoring loop with curses UI
@@ -820,11 +1200,15 @@ def run_monitor(stdscr: CursesWindow, pid_list: List[int], logger: Optional[Debu
     curses.curs_set(0)
     
     tracked_files = {}
+    tracked_rows: List[Tuple[int, FileTransferInfo]] = []  # tracked_files in display order
     iteration = 0
-    episode_cache = {}  # Cache for episode info extraction
-    path_abbreviation_cache = {}  # Cache for abbreviated paths: (path, width) -> abbreviated_path
     process_name_cache: Dict[int, str] = {}  # Cache for process names: pid -> name
+    active_pids = list(pid_list)  # Monitored PIDs that have not exited yet
+    last_active_count = len(pid_list)  # Number of monitored PIDs still alive
+    screen_buffer = ScreenBuffer()  # Previously drawn rows for differential redraw
     last_terminal_width = 0  # Track terminal width to detect resizes
+    last_render_state = None  # State shown by the last drawn frame
+    idle_ticks = 0  # Consecutive scans with no active writes
     
     while True:
         try:
@@ -836,17 +1220,6 @@ def run_monitor(stdscr: CursesWindow, pid_list: List[int], logger: Optional[Debu
                     logger.log("User quit")
                 break
             
-            active_pids = [p for p in pid_list if psutil.pid_exists(p)]
-            if not active_pids:
-                if logger:
-                    logger.log("All processes exited")
-                stdscr.clear()
-                stdscr.addstr(0, 0, "All monitored processes have exited.", curses.A_BOLD)
-                stdscr.addstr(1, 0, "Press any key to exit...")
-                stdscr.nodelay(False)
-                stdscr.getch()
-                break
-            
             # Only do verbose logging on first iteration or periodically
             # to avoid duplicate scanning overhead
             verbose_this_iteration = (iteration == 1 or iteration % Config.VERBOSE_LOG_INTERVAL == 0) and logger and logger.is_enabled
@@ -854,34 +1227,54 @@ def run_monitor(stdscr: CursesWindow, pid_list: List[int], logger: Optional[Debu
             if verbose_this_iteration:
                 logger.log(f"=== Scan iteration {iteration} ===")
             
-            # Trim episode cache if it grows too large to prevent unbounded memory growth
-            # Remove oldest 20% of entries instead of clearing all
-            if len(episode_cache) > Config.EPISODE_CACHE_MAX_SIZE:
-                entries_to_remove = Config.EPISODE_CACHE_MAX_SIZE // 5
-                if logger:
-                    logger.log(f"Episode cache size {len(episode_cache)} exceeded limit, removing {entries_to_remove} oldest entries")
-                for _ in range(entries_to_remove):
-                    if episode_cache:
-                        episode_cache.pop(next(iter(episode_cache)))
-            
+            # The scan doubles as the liveness check: a PID whose /proc entry
+            # is gone is dropped for good, since it can only come back as a
+            # different process
             current_files = {}
+            exited_pids = []
             for pid in active_pids:
-                pid_files = get_open_files(pid, logger=logger, verbose_log=verbose_this_iteration, episode_cache=episode_cache)
-                for file_key, file_info in pid_files.items():
-                    current_files[(pid, file_key)] = file_info
+                known_keys = {file_key for file_pid, file_key in tracked_files if file_pid == pid}
+                pid_files = get_open_files(pid, logger=logger, verbose_log=verbose_this_iteration,
+                                           known_keys=known_keys)
+                if pid_files is None:
+                    exited_pids.append(pid)
+                    continue
+                for file_key, write_file in pid_files.items():
+                    current_files[(pid, file_key)] = write_file
+            if exited_pids:
+                if logger:
+                    logger.log(f"Processes exited: {exited_pids}")
+                active_pids = [pid for pid in active_pids if pid not in exited_pids]
+            
+            if not active_pids:
+                if logger:
+                    logger.log("All processes exited")
+                stdscr.clear()
+                stdscr.addstr(0, 0, "All monitored processes have exited.", curses.A_BOLD)
+                stdscr.addstr(1, 0, "Press any key to exit...")
+                stdscr.nodelay(False)
+                stdscr.getch()
+                break
             
             if verbose_this_iteration:
                 logger.log(f"Total files found across all PIDs: {len(current_files)}")
             
-            for file_key, file_info in current_files.items():
-                if file_key in tracked_files:
-                    old_pos = tracked_files[file_key].position
-                    tracked_files[file_key].update(file_info.size)
-                    new_pos = tracked_files[file_key].position
+            # One timestamp for the whole tick; every file was sampled in this scan
+            now = time.time()
+            files_changed = False
+            for file_key, write_file in current_files.items():
+                file_info = tracked_files.get(file_key)
+                if file_info is not None:
+                    old_pos = file_info.position
+                    file_info.update(write_file.size, now)
+                    new_pos = file_info.position
                     if verbose_this_iteration and old_pos != new_pos:
                         logger.log(f"  Updated: {file_info.filename} {old_pos} -> {new_pos}")
                 else:
+                    # Only allocate tracking state for files seen for the first time
+                    file_info = FileTransferInfo.from_write_file(write_file, now)
                     tracked_files[file_key] = file_info
+                    files_changed = True
                     if logger:
                         logger.log(f"  New file tracked: {file_info.filename} at {file_info.position}/{file_info.target_size}")
             
@@ -890,10 +1283,16 @@ def run_monitor(stdscr: CursesWindow, pid_list: List[int], logger: Optional[Debu
                 if logger:
                     logger.log(f"  File closed: {tracked_files[file_key].filename}")
                 del tracked_files[file_key]
+                files_changed = True
+            
+            # Re-sort the display list only when files were opened or closed
+            if files_changed:
+                tracked_rows = _display_order(tracked_files)
             
-            # Clean up process name cache for PIDs that no longer exist
-            # Check periodically to avoid overhead on every iteration
-            if iteration % Config.VERBOSE_LOG_INTERVAL == 0:
+            # Clean up process name cache as soon as a monitored PID exits;
+            # monitored PIDs only ever drop out, so a shorter list means stale entries
+            if len(active_pids) != last_active_count:
+                last_active_count = len(active_pids)
                 stale_pids = [pid for pid in process_name_cache if pid not in active_pids]
                 for pid in stale_pids:
                     del process_name_cache[pid]
@@ -902,10 +1301,12 @@ def run_monitor(stdscr: CursesWindow, pid_list: List[int], logger: Optional[Debu
             
             # Handle terminal resize by clearing path cache
             # Path abbreviations are width-dependent, so we need to recalculate them
+            terminal_size = None
             try:
-                current_width = stdscr.getmaxyx()[1]
+                terminal_size = stdscr.getmaxyx()
+                current_width = terminal_size[1]
                 if current_width != last_terminal_width:
-                    path_abbreviation_cache.clear()
+                    abbreviate_path.cache_clear()
                     last_terminal_width = current_width
                     if logger:
                         logger.log(f"Terminal resized to width {current_width}, cleared path cache")
@@ -913,9 +1314,29 @@ def run_monitor(stdscr: CursesWindow, pid_list: List[int], logger: Optional[Debu
                 # Terminal might be in invalid state during resize
                 pass
             
-            draw_ui(stdscr, active_pids, tracked_files, path_abbreviation_cache, process_name_cache)
+            # Skip the redraw when nothing visible changed since the last frame:
+            # same files and progress, same terminal size, same clock second.
+            # An empty screen buffer means the last draw failed or never happened.
+            render_state = (int(now), terminal_size, tuple(active_pids),
+                            _render_fingerprint(tracked_rows))
+            if render_state != last_render_state or not screen_buffer.rows:
+                draw_ui(stdscr, active_pids, tracked_rows, process_name_cache, screen_buffer)
+                last_render_state = render_state
             
-            time.sleep(Config.POLL_INTERVAL_SECONDS)
+            # Back off while nothing is being written and snap back as soon as
+            # a write appears. The wait happens in the next getch(), so a
+            # keypress still wakes the loop immediately.
+            if tracked_files:
+                idle_ticks = 0
+                poll_interval = Config.POLL_INTERVAL_SECONDS
+            else:
+                idle_ticks += 1
+                poll_interval = min(Config.IDLE_POLL_INTERVAL_MAX_SECONDS,
+                                    Config.POLL_INTERVAL_SECONDS * (1 + idle_ticks * Config.IDLE_POLL_BACKOFF_FACTOR))
+            stdscr.timeout(int(poll_interval * 1000))
+            
+            if logger:
+                logger.flush()
         
         except KeyboardInterrupt:
             if logger:
@@ -927,13 +1348,6 @@ def run_monitor(stdscr: CursesWindow, pid_list: List[int], logger: Optional[Debu
                 logger.log(f"Curses error: {e}")
             time.sleep(Config.POLL_INTERVAL_SECONDS)
             continue
-        except psutil.NoSuchProcess as e:
-            # Process disappeared during monitoring
-            if logger:
-                logger.log(f"Process no longer exists: {e}")
-            # Will be caught by active_pids check on next iteration
-            time.sleep(Config.POLL_INTERVAL_SECONDS)
-            continue
         except (OSError, IOError) as e:
             # File system errors (permission denied, file not found, etc.)
             if logger:
@@ -963,44 +1377,66 @@ def main() -> int:
                        help='Show debug information')
     parser.add_argument('--log', type=str, metavar='FILE',
                        help='Enable debug logging to specified file')
+    parser.add_argument('--log-mode', choices=('disk', 'ram'), default='disk',
+                       help='Write the log as it goes (disk) or keep it in memory until exit (ram)')
     parser.add_argument('--all', action='store_true',
                        help='Automatically monitor all detected *arr processes')
     
     args = parser.parse_args()
     
     # Create logger context manager
-    logger = DebugLogger(args.log) if args.log else DebugLogger()
+    logger = DebugLogger(args.log, in_memory=args.log_mode == 'ram') if args.log else DebugLogger()
     
     if args.pids:
         pids = args.pids
-        for pid in pids:
-            if not psutil.pid_exists(pid):
-                print(f"Error: Process {pid} does not exist")
-                return 1
-        
-        if len(pids) == 1:
-            try:
-                proc = psutil.Process(pids[0])
-                print(f"Monitoring: {proc.name()} (PID: {pids[0]})")
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                print(f"Monitoring PID: {pids[0]}")
-        else:
-            print(f"Monitoring {len(pids)} processes: {', '.join(map(str, pids))}")
     elif args.all:
         processes = find_arr_processes()
         if not processes:
             print("No *arr processes found running.")
             print(f"\nAvailable managers: {', '.join(ARR_MANAGERS)}")
             return 1
-        pids = [pid for pid, name in processes]
-        print(f"Auto-detected {len(pids)} process(es):")
+        print(f"Auto-detected {len(processes)} process(es):")
+        pids = []
         for pid, name in processes:
+            pids.append(pid)
             print(f"  - {name} (PID: {pid})")
     else:
         pids = select_process_interactive()
         if pids is None:
             return 1
     
+    # Single pass over the selected PIDs: PIDs given on the command line must
+    # exist (their comm name doubles as the banner), and the UI needs to be
+    # able to read every fd table (always true for root, so skip the probe)
+    probe_fd_access = not args.debug and os.geteuid() != 0
+    names = []
+    for pid in pids:
+        if args.pids:
+            name = read_process_name(pid)
+            if name is None:
+                print(f"Error: Process {pid} does not exist")
+                return 1
+            names.append(name)
+        
+        if probe_fd_access:
+            try:
+                # Opening the directory raises the same errors as listing it, without
+                # building an entry per open FD
+                os.close(os.open(f"/proc/{pid}/fd", os.O_RDONLY | os.O_DIRECTORY))
+            except PermissionError:
+                print(f"\nError: Permission denied for PID {pid}. Try running with sudo:")
+                print(f"  sudo {sys.argv[0]} {' '.join(map(str, pids))}")
+                return 1
+            except FileNotFoundError:
+                print(f"\nError: Process {pid} no longer exists")
+                return 1
+    
+    if args.pids:
+        if len(pids) == 1:
+            print(f"Monitoring: {names[0]} (PID: {pids[0]})")
+        else:
+            print(f"Monitoring {len(pids)} processes: {', '.join(map(str, pids))}")
+    
     if args.debug:
         # Use logger context manager even in debug mode
         with logger:
@@ -1011,24 +1447,13 @@ def main() -> int:
                     print("No files found matching criteria")
                 else:
                     print(f"\nFound {len(files)} file(s) being written:")
-                    for key, info in files.items():
+                    for key, write_file in files.items():
+                        info = FileTransferInfo.from_write_file(write_file)
                         print(f"\n  FD {info.fd}: {info.filepath}")
                         print(f"    Position: {info.position}, Target: {info.target_size}")
                         print(f"    Percent: {info.percent:.1f}%")
         return 0
     
-    for pid in pids:
-        try:
-            test_dir = Path(f"/proc/{pid}/fd")
-            list(test_dir.iterdir())
-        except PermissionError:
-            print(f"\nError: Permission denied for PID {pid}. Try running with sudo:")
-            print(f"  sudo {sys.argv[0]} {' '.join(map(str, pids))}")
-            return 1
-        except FileNotFoundError:
-            print(f"\nError: Process {pid} no longer exists")
-            return 1
-    
     # Use logger as context manager
     with logger:
         if logger.is_enabled:
@@ -1048,6 +1473,9 @@ def main() -> int:
             if logger.is_enabled:
                 logger.log(f"Error in curses interface: {e}")
             raise
+        finally:
+            # Get buffered lines onto disk before any traceback is printed
+            logger.flush()
         
         if logger.is_enabled:
             logger.log("Exiting")